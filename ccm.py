@@ -1,13 +1,67 @@
 #!/usr/bin/env python3
 
+import bisect
 import json
+import mmap
 import os
+import shutil
+import signal
 import sys
+import textwrap
 from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
 from typing import Dict, List, Any
 import curses
 from pathlib import Path
 
+try:
+    import orjson  # Optional: much faster parse/dump for large configs
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional: stream-parse very large configs (picks yajl2_c when built)
+except ImportError:
+    ijson = None
+
+# Parse errors raised by ijson (not ValueError subclasses)
+_IJSON_ERRORS = (ijson.JSONError,) if ijson is not None else ()
+
+
+class _SanitizeTable(dict):
+    """str.translate table that maps every character outside [a-zA-Z0-9] to '-'"""
+    def __missing__(self, codepoint):
+        # Only non-ASCII characters get here; all 128 ASCII entries are prefilled
+        return '-'
+
+
+# Characters Claude replaces with '-' when naming ~/.claude/projects directories
+_SANITIZE_TABLE = _SanitizeTable(
+    (c, chr(c) if chr(c).isascii() and chr(c).isalnum() else '-') for c in range(128)
+)
+
+# Configs at least this large are memory-mapped for orjson instead of read into a copy
+MMAP_MIN_SIZE = 10 * 1024 * 1024
+
+# Configs at least this large are stream-parsed, leaving project histories on disk
+STREAMING_MIN_SIZE = 10 * 1024 * 1024
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp_ms(timestamp: int) -> str:
+    """Format a millisecond timestamp as local time (memoized: few distinct values per session)"""
+    try:
+        dt = datetime.fromtimestamp(timestamp / 1000)  # Convert from milliseconds
+        return dt.strftime("%Y-%m-%d %H:%M:%S")
+    except:
+        return "N/A"
+
+
+def _exit_on_signal(signum, frame):
+    """Turn a termination signal into SystemExit so cleanup handlers run"""
+    sys.exit(128 + signum)
+
 
 class ClaudeConfigManager:
     def __init__(self, config_path: str = None):
@@ -19,13 +73,66 @@ class ClaudeConfigManager:
         
         # Get absolute path
         self.config_path = os.path.abspath(self.config_path)
-        self.config = self.load_config()
         
+        # Per-project data directories live under ~/.claude/projects
+        self.projects_dir = os.path.expanduser("~/.claude/projects")
+        # Existing project directories by name, so deletes need no per-path stat calls
+        self._project_dir_index = self._scan_project_dirs()
+        
+        # Set by delete_* methods; changes are written once by flush()
+        self._dirty = False
+        
+        # (mtime_ns, size) of the config when it was last read or written
+        self._config_stamp = None
+        self._load()
+        
+    def _stat_config(self):
+        """Return the config file's (mtime_ns, size), or None if it can't be read"""
+        try:
+            st = os.stat(self.config_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _use_streaming(self, stamp) -> bool:
+        """Stream-parse large configs; the full document is loaded only before a write"""
+        config_size = stamp[1] if stamp else 0
+        return ijson is not None and config_size >= STREAMING_MIN_SIZE
+    
+    def _load(self):
+        """Load the config at startup, exiting if it can't be read"""
+        self._config_stamp = self._stat_config()
+        self.lazy_history = self._use_streaming(self._config_stamp)
+        if self.lazy_history:
+            self.config = self.load_config_streaming()
+        else:
+            self.config = self.load_config()
+    
+    def _reload_if_changed(self):
+        """Re-read the config if another process rewrote it since we loaded it"""
+        # Never drop deletions that haven't been flushed yet
+        if self._dirty:
+            return
+        stamp = self._stat_config()
+        if stamp is None or stamp == self._config_stamp:
+            return
+        lazy_history = self._use_streaming(stamp)
+        try:
+            if lazy_history:
+                config = self._parse_config_streaming()
+            else:
+                config = self._parse_config()
+        except (OSError, ValueError) + _IJSON_ERRORS:
+            # Most likely caught mid-write; keep the current config and retry next time
+            return
+        self.config = config
+        self.lazy_history = lazy_history
+        self._config_stamp = stamp
+    
     def load_config(self) -> Dict:
         """Load configuration from JSON file"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return self._parse_config()
         except FileNotFoundError:
             print(f"Error: {self.config_path} not found")
             sys.exit(1)
@@ -33,74 +140,234 @@ class ClaudeConfigManager:
             print(f"Error parsing JSON: {e}")
             sys.exit(1)
     
+    def load_config_streaming(self) -> Dict:
+        """Load configuration, leaving project histories on disk"""
+        try:
+            return self._parse_config_streaming()
+        except FileNotFoundError:
+            print(f"Error: {self.config_path} not found")
+            sys.exit(1)
+        except ijson.JSONError as e:
+            print(f"Error parsing JSON: {e}")
+            sys.exit(1)
+    
+    def _parse_config(self) -> Dict:
+        """Parse the config file, raising OSError/ValueError if it can't be read"""
+        # Parse bytes directly; the parser decodes UTF-8 itself
+        with open(self.config_path, 'rb') as f:
+            if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+            data = f.read()
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    
+    def _parse_config_streaming(self) -> Dict:
+        """Parse the config without materializing project histories
+        
+        Each project's 'history' list is replaced by a 'history_len' count;
+        use load_project_history() to read the entries when they are needed.
+        """
+        builder = ijson.ObjectBuilder()
+        depth = 0
+        top_key = None
+        in_history = False
+        skip_depth = 0  # Nesting level inside a skipped history array
+        history_len = 0
+        with open(self.config_path, 'rb') as f:
+            # Without use_float, integers of any width stay exact (yajl2_c's use_float
+            # rejects ones past 64 bits); only fractions come back as Decimal
+            for _, event, value in ijson.parse(f):
+                if skip_depth:
+                    # Count history items without building them
+                    if skip_depth == 1 and event not in ('end_map', 'end_array'):
+                        history_len += 1
+                    if event in ('start_map', 'start_array'):
+                        skip_depth += 1
+                    elif event in ('end_map', 'end_array'):
+                        skip_depth -= 1
+                        if skip_depth == 0:
+                            builder.event('number', history_len)
+                    continue
+                
+                if in_history:
+                    in_history = False
+                    if event == 'start_array':
+                        skip_depth = 1
+                        history_len = 0
+                        continue
+                
+                if event == 'number' and isinstance(value, Decimal):
+                    value = float(value)  # Match what json/orjson return
+                elif event == 'map_key':
+                    if depth == 1:
+                        top_key = value
+                    elif depth == 3 and top_key == 'projects' and value == 'history':
+                        in_history = True
+                        value = 'history_len'
+                
+                builder.event(event, value)
+                if event in ('start_map', 'start_array'):
+                    depth += 1
+                elif event in ('end_map', 'end_array'):
+                    depth -= 1
+        return builder.value
+    
+    def load_project_history(self, project_path: str) -> List:
+        """Read one project's history from disk (streamed configs only)"""
+        if not self.lazy_history:
+            return []
+        try:
+            with open(self.config_path, 'rb') as f:
+                return list(ijson.items(f, f'projects.{project_path}.history.item'))
+        except (OSError, ValueError) + _IJSON_ERRORS:
+            # Replaced or partway through a write; show no history rather than crash
+            return []
+    
+    def _ensure_full_config(self) -> bool:
+        """Replace a streamed config with the full document before modifying it
+        
+        Returns False, keeping the streamed config, if the file can't be
+        parsed right now (e.g. another process is partway through writing it).
+        """
+        if self.lazy_history:
+            stamp = self._stat_config()
+            try:
+                config = self._parse_config()
+            except (OSError, ValueError):
+                return False
+            self.config = config
+            self._config_stamp = stamp
+            self.lazy_history = False
+        return True
+    
     def save_config(self):
-        """Save configuration to JSON file"""
-        with open(self.config_path, 'w', encoding='utf-8') as f:
-            json.dump(self.config, f, indent=2, ensure_ascii=False)
+        """Save configuration to JSON file
+        
+        The data is written to a temporary file which then replaces the
+        config, so an interrupted write never leaves a truncated file behind.
+        """
+        if orjson is not None:
+            data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            data = json.dumps(self.config, indent=2, ensure_ascii=False).encode('utf-8')
+        
+        # Write through symlinks and keep the original file permissions
+        target_path = os.path.realpath(self.config_path)
+        tmp_path = target_path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            try:
+                os.chmod(tmp_path, os.stat(target_path).st_mode & 0o777)
+            except OSError:
+                pass
+            os.replace(tmp_path, target_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._config_stamp = self._stat_config()
+        self._dirty = False
+    
+    def flush(self):
+        """Write pending changes to disk"""
+        if self._dirty:
+            self.save_config()
+    
+    def _scan_project_dirs(self) -> Dict[str, str]:
+        """Map entry names in the projects directory to their paths"""
+        try:
+            with os.scandir(self.projects_dir) as entries:
+                return {entry.name: entry.path for entry in entries}
+        except OSError:
+            return {}
     
     def get_mcp_servers(self) -> Dict:
         """Get MCP servers from config"""
+        self._reload_if_changed()
         return self.config.get('mcpServers', {})
     
     def get_projects(self) -> Dict:
         """Get projects from config"""
+        self._reload_if_changed()
         return self.config.get('projects', {})
     
     def delete_mcp_server(self, server_name: str):
         """Delete a specific MCP server"""
+        if not self._ensure_full_config():
+            return False
         if 'mcpServers' in self.config and server_name in self.config['mcpServers']:
             del self.config['mcpServers'][server_name]
-            self.save_config()
+            self._dirty = True
             return True
         return False
     
     def delete_all_mcp_servers(self):
         """Delete all MCP servers"""
+        if not self._ensure_full_config():
+            return False
         if 'mcpServers' in self.config:
             self.config['mcpServers'] = {}
-            self.save_config()
+            self._dirty = True
             return True
         return False
     
     def delete_project(self, project_path: str):
         """Delete a specific project"""
+        if not self._ensure_full_config():
+            return False
         if 'projects' in self.config and project_path in self.config['projects']:
             del self.config['projects'][project_path]
-            self.save_config()
+            self._dirty = True
             
             # Delete corresponding .claude/projects directory
             # Convert path to match Claude's naming convention
-            import re
-            sanitized_path = re.sub(r'[^a-zA-Z0-9]', '-', project_path)
+            sanitized_path = project_path.translate(_SANITIZE_TABLE)
             # Also try with just slash replacement (both patterns observed)
             alt_sanitized_path = project_path.replace('/', '-')
             
-            claude_project_dirs = [
-                os.path.expanduser(f"~/.claude/projects/{sanitized_path}"),
-                os.path.expanduser(f"~/.claude/projects/{alt_sanitized_path}"),
-                os.path.expanduser(f"~/.claude/projects{alt_sanitized_path}")  # Without slash
-            ]
+            claude_project_dirs = []
+            for dir_name in dict.fromkeys((sanitized_path, alt_sanitized_path)):
+                dir_path = self._project_dir_index.pop(dir_name, None)
+                if dir_path is None:
+                    # Claude may have created the directory after the index was built
+                    candidate = os.path.join(self.projects_dir, dir_name)
+                    if os.path.exists(candidate):
+                        dir_path = candidate
+                if dir_path is not None:
+                    claude_project_dirs.append(dir_path)
+            
+            # Without slash (a sibling of the projects directory, so not indexed)
+            unslashed_dir = f"{self.projects_dir}{alt_sanitized_path}"
+            if os.path.exists(unslashed_dir):
+                claude_project_dirs.append(unslashed_dir)
             
-            import shutil
             for claude_project_dir in claude_project_dirs:
-                if os.path.exists(claude_project_dir):
-                    try:
-                        shutil.rmtree(claude_project_dir)
-                    except Exception:
-                        pass  # Silently ignore errors
+                try:
+                    shutil.rmtree(claude_project_dir)
+                except Exception:
+                    pass  # Silently ignore errors
             
             return True
         return False
     
     def delete_all_projects(self):
         """Delete all projects"""
+        if not self._ensure_full_config():
+            return False
         if 'projects' in self.config:
             self.config['projects'] = {}
-            self.save_config()
+            self._dirty = True
             
             # Delete entire .claude/projects directory and recreate it empty
-            import shutil
-            claude_projects_dir = os.path.expanduser("~/.claude/projects")
+            claude_projects_dir = self.projects_dir
             if os.path.exists(claude_projects_dir):
                 try:
                     # Remove the entire directory
@@ -109,6 +376,7 @@ class ClaudeConfigManager:
                     os.makedirs(claude_projects_dir, exist_ok=True)
                 except Exception:
                     pass  # Silently ignore errors
+            self._project_dir_index = self._scan_project_dirs()
             
             return True
         return False
@@ -119,40 +387,79 @@ class InteractiveMenu:
     def __init__(self, config_manager: ClaudeConfigManager):
         self.config_manager = config_manager
         self.current_menu = "main"
+        # Header lines shared by every menu screen
+        self._config_path_text = f"📁 Config: {self.config_manager.config_path}"
+        self._projects_dir_text = f"📂 Projects: {self.config_manager.projects_dir}"
+        # Project paths, most recently generated first, and the projects dict they came from
+        self._sorted_project_paths = None
+        self._sorted_projects_source = None
+        # Formatted rows per server name / project path, reused across rebuilds
+        self._server_row_cache = {}
+        self._project_row_cache = {}
+        # Directory count for the projects title, keyed by the directory's mtime
+        self._claude_dir_count = 0
+        self._claude_dir_mtime = None
+        # Off-screen pad holding the rendered rows of the current item list
+        self._items_pad = None
+        self._pad_items = None
+        self._pad_width = 0
+        self._pad_selected = None
+        self._pad_multi_line = False
+        self._pad_item_lines = []
+        self._pad_line_offsets = [0]
         
     def format_timestamp(self, timestamp: int) -> str:
         """Convert timestamp to Korean time string"""
         try:
-            dt = datetime.fromtimestamp(timestamp / 1000)  # Convert from milliseconds
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
-        except:
+            return _format_timestamp_ms(timestamp)
+        except TypeError:  # Unhashable values can't go through the cache
             return "N/A"
     
+    def _input_pending(self, stdscr) -> bool:
+        """Check whether a key is already queued, without consuming it
+        
+        Menus skip drawing while keys are pending, so auto-repeat from a held
+        arrow key is applied in full before the next frame is drawn.
+        """
+        stdscr.nodelay(True)
+        try:
+            key = stdscr.getch()
+        finally:
+            stdscr.nodelay(False)
+        if key == -1:
+            return False
+        curses.ungetch(key)
+        return True
+    
     def show_confirmation(self, stdscr, title: str, message: str, warning: str = "") -> bool:
         """Show confirmation dialog with y/N prompt"""
+        redraw = True
         while True:
-            stdscr.clear()
-            h, w = stdscr.getmaxyx()
-            
-            # Calculate center position
-            start_y = h // 2 - 5
-            
-            # Draw confirmation box
-            stdscr.addstr(start_y, 0, "═" * min(w-1, 60))
-            stdscr.addstr(start_y + 1, 0, title, curses.A_BOLD)
-            stdscr.addstr(start_y + 2, 0, "═" * min(w-1, 60))
-            
-            # Show message
-            stdscr.addstr(start_y + 4, 0, message)
-            if warning:
-                stdscr.addstr(start_y + 5, 0, warning, curses.A_BOLD | curses.A_REVERSE)
-            
-            # Show prompt
-            prompt_y = start_y + 7 if warning else start_y + 6
-            stdscr.addstr(prompt_y, 0, "Are you sure? (y/N): ")
-            stdscr.addstr(prompt_y + 1, 0, "💡 Press ← to cancel", curses.A_DIM)
-            
-            stdscr.refresh()
+            # The dialog is static: draw it once, and again only after a resize
+            if redraw:
+                stdscr.erase()
+                h, w = stdscr.getmaxyx()
+                
+                # Calculate center position
+                start_y = h // 2 - 5
+                
+                # Draw confirmation box
+                stdscr.addstr(start_y, 0, "═" * min(w-1, 60))
+                stdscr.addstr(start_y + 1, 0, title, curses.A_BOLD)
+                stdscr.addstr(start_y + 2, 0, "═" * min(w-1, 60))
+                
+                # Show message
+                stdscr.addstr(start_y + 4, 0, message)
+                if warning:
+                    stdscr.addstr(start_y + 5, 0, warning, curses.A_BOLD | curses.A_REVERSE)
+                
+                # Show prompt
+                prompt_y = start_y + 7 if warning else start_y + 6
+                stdscr.addstr(prompt_y, 0, "Are you sure? (y/N): ")
+                stdscr.addstr(prompt_y + 1, 0, "💡 Press ← to cancel", curses.A_DIM)
+                
+                stdscr.refresh()
+                redraw = False
             
             # Get user input
             key = stdscr.getch()
@@ -161,126 +468,164 @@ class InteractiveMenu:
                 return True
             elif key == ord('n') or key == ord('N') or key == curses.KEY_LEFT or key == ord('\n'):  # N, Left arrow, or Enter (default is No)
                 return False
+            elif key == curses.KEY_RESIZE:
+                redraw = True
+    
+    def _draw_history_row(self, stdscr, y: int, index: int, hist_item: Dict, is_selected: bool, w: int):
+        """Draw a single conversation history row"""
+        if is_selected:
+            stdscr.attron(curses.A_REVERSE)
+        
+        display_text = hist_item.get('display', 'No display text')
+        
+        # Check if this is a pasted text item
+        pasted_preview = ""
+        if "[Pasted text" in display_text:
+            pasted_contents = hist_item.get('pastedContents', {})
+            if pasted_contents:
+                # Get first pasted content preview
+                for key, value in pasted_contents.items():
+                    if value:
+                        # Get first 80 chars of pasted content
+                        preview = str(value).replace('\n', ' ').strip()
+                        if len(preview) > 80:
+                            preview = preview[:77] + "..."
+                        pasted_preview = f" | {preview}"
+                        break
+        
+        # Truncate display text if needed
+        max_display_len = w - 10 - len(pasted_preview)
+        if len(display_text) > max_display_len:
+            display_text = display_text[:max_display_len-3] + "..."
+        
+        # Build line text
+        line_text = f"{index+1:3}. {display_text}"
+        
+        # Draw main text
+        try:
+            stdscr.addstr(y, 0, line_text[:w-2])
+            
+            # Draw pasted preview in gray (DIM)
+            if pasted_preview:
+                x_pos = len(line_text)
+                if x_pos + len(pasted_preview) < w - 2:
+                    stdscr.addstr(y, x_pos, pasted_preview, curses.A_DIM)
+        except curses.error:
+            pass
+        
+        if is_selected:
+            stdscr.attroff(curses.A_REVERSE)
     
     def show_project_history(self, stdscr, project_path: str, project_data: Dict):
         """Show conversation history for a project"""
-        history = project_data.get('history', [])
+        history = project_data.get('history')
+        if history is None:
+            # Streamed configs keep histories on disk until they are viewed
+            history = self.config_manager.load_project_history(project_path)
         project_name = os.path.basename(project_path) or project_path
         selected_idx = 0
         scroll_offset = 0
         
+        # Values that stay fixed while this screen is open
+        n = len(history)
+        project_line = f"📂 Project: {project_name}"
+        total_line = f"💬 Total conversations: {n}"
+        
+        # State of the last drawn frame, used to redraw only what changed
+        prev_selected_idx = None
+        prev_scroll_offset = None
+        prev_size = None
+        
         while True:
-            stdscr.clear()
             h, w = stdscr.getmaxyx()
-            
-            # Draw header
-            stdscr.addstr(0, 0, f"📂 Project: {project_name}", curses.A_BOLD)
-            stdscr.addstr(1, 0, f"📍 Path: {project_path[:w-10]}")
-            stdscr.addstr(2, 0, f"💬 Total conversations: {len(history)}")
-            stdscr.addstr(3, 0, "═" * min(w-1, 60))
-            stdscr.addstr(4, 0, "💡 PgUp/PgDn: page, ↑/↓: item, ← to go back")
-            stdscr.addstr(5, 0, "═" * min(w-1, 60))
-            
-            # Display history items
             start_y = 7
             visible_height = h - start_y - 2
             
-            if not history:
-                stdscr.addstr(start_y, 0, "No conversation history")
-            else:
+            if history:
                 # Calculate scroll position
                 if selected_idx >= scroll_offset + visible_height:
                     scroll_offset = selected_idx - visible_height + 1
                 elif selected_idx < scroll_offset:
                     scroll_offset = selected_idx
                 
-                # Display visible items
-                for i in range(scroll_offset, min(scroll_offset + visible_height, len(history))):
-                    if start_y + (i - scroll_offset) >= h - 2:
-                        break
-                    
-                    is_selected = i == selected_idx
-                    if is_selected:
-                        stdscr.attron(curses.A_REVERSE)
-                    
-                    hist_item = history[i]
-                    display_text = hist_item.get('display', 'No display text')
-                    
-                    # Check if this is a pasted text item
-                    pasted_preview = ""
-                    if "[Pasted text" in display_text:
-                        pasted_contents = hist_item.get('pastedContents', {})
-                        if pasted_contents:
-                            # Get first pasted content preview
-                            for key, value in pasted_contents.items():
-                                if value:
-                                    # Get first 80 chars of pasted content
-                                    preview = str(value).replace('\n', ' ').strip()
-                                    if len(preview) > 80:
-                                        preview = preview[:77] + "..."
-                                    pasted_preview = f" | {preview}"
-                                    break
-                    
-                    # Truncate display text if needed
-                    max_display_len = w - 10 - len(pasted_preview)
-                    if len(display_text) > max_display_len:
-                        display_text = display_text[:max_display_len-3] + "..."
-                    
-                    # Build line text
-                    line_text = f"{i+1:3}. {display_text}"
-                    
-                    # Draw main text
+                end = min(scroll_offset + visible_height, n)
+                total_pages = max(1, (n + visible_height - 1) // visible_height)
+                current_page = (selected_idx // visible_height) + 1
+                position_text = f"[{selected_idx + 1}/{n}]  Page {current_page}/{total_pages}"
+            
+            if not self._input_pending(stdscr):
+                if (prev_size == (h, w) and scroll_offset == prev_scroll_offset
+                        and abs(selected_idx - prev_selected_idx) <= 1):
+                    # Selection moved to a neighbouring visible row:
+                    # repaint just the two affected rows and the position indicator
+                    for i in (prev_selected_idx, selected_idx):
+                        self._draw_history_row(stdscr, start_y + (i - scroll_offset), i, history[i],
+                                               i == selected_idx, w)
                     try:
-                        y_pos = start_y + (i - scroll_offset)
-                        stdscr.addstr(y_pos, 0, line_text[:w-2])
-                        
-                        # Draw pasted preview in gray (DIM)
-                        if pasted_preview:
-                            x_pos = len(line_text)
-                            if x_pos + len(pasted_preview) < w - 2:
-                                stdscr.addstr(y_pos, x_pos, pasted_preview, curses.A_DIM)
+                        stdscr.move(h - 1, 0)
+                        stdscr.clrtoeol()
+                        stdscr.addstr(h - 1, w - len(position_text) - 2, position_text, curses.A_DIM)
                     except curses.error:
                         pass
+                else:
+                    stdscr.erase()
                     
-                    if is_selected:
-                        stdscr.attroff(curses.A_REVERSE)
+                    # Draw header
+                    stdscr.addstr(0, 0, project_line, curses.A_BOLD)
+                    stdscr.addstr(1, 0, f"📍 Path: {project_path[:w-10]}")
+                    stdscr.addstr(2, 0, total_line)
+                    stdscr.addstr(3, 0, "═" * min(w-1, 60))
+                    stdscr.addstr(4, 0, "💡 PgUp/PgDn: page, ↑/↓: item, ← to go back")
+                    stdscr.addstr(5, 0, "═" * min(w-1, 60))
+                    
+                    # Display history items
+                    if not history:
+                        stdscr.addstr(start_y, 0, "No conversation history")
+                    else:
+                        # Display visible items
+                        for i in range(scroll_offset, end):
+                            if start_y + (i - scroll_offset) >= h - 2:
+                                break
+                            self._draw_history_row(stdscr, start_y + (i - scroll_offset), i, history[i],
+                                                   i == selected_idx, w)
+                        
+                        # Show position and page indicators
+                        try:
+                            stdscr.addstr(h - 1, w - len(position_text) - 2, position_text, curses.A_DIM)
+                        except curses.error:
+                            pass
+                        
+                        # Show scroll indicators
+                        if scroll_offset > 0:
+                            try:
+                                stdscr.addstr(start_y - 1, w - 10, "▲ MORE", curses.A_DIM)
+                            except curses.error:
+                                pass
+                        if scroll_offset + visible_height < n:
+                            try:
+                                stdscr.addstr(h - 2, w - 10, "▼ MORE", curses.A_DIM)
+                            except curses.error:
+                                pass
+                    
+                    # An empty history has no rows to update incrementally
+                    prev_size = (h, w) if history else None
                 
-                # Show position and page indicators
-                if history:
-                    total_pages = max(1, (len(history) + visible_height - 1) // visible_height)
-                    current_page = (selected_idx // visible_height) + 1
-                    position_text = f"[{selected_idx + 1}/{len(history)}]  Page {current_page}/{total_pages}"
-                    try:
-                        stdscr.addstr(h - 1, w - len(position_text) - 2, position_text, curses.A_DIM)
-                    except curses.error:
-                        pass
+                prev_selected_idx = selected_idx
+                prev_scroll_offset = scroll_offset
+                stdscr.refresh()
                 
-                # Show scroll indicators
-                if scroll_offset > 0:
-                    try:
-                        stdscr.addstr(start_y - 1, w - 10, "▲ MORE", curses.A_DIM)
-                    except curses.error:
-                        pass
-                if scroll_offset + visible_height < len(history):
-                    try:
-                        stdscr.addstr(h - 2, w - 10, "▼ MORE", curses.A_DIM)
-                    except curses.error:
-                        pass
-            
-            stdscr.refresh()
-            
             # Handle input
             key = stdscr.getch()
             
             if key == curses.KEY_UP:
                 if history:
                     if selected_idx == 0:
-                        selected_idx = len(history) - 1
+                        selected_idx = n - 1
                     else:
                         selected_idx -= 1
             elif key == curses.KEY_DOWN:
                 if history:
-                    if selected_idx == len(history) - 1:
+                    if selected_idx == n - 1:
                         selected_idx = 0
                     else:
                         selected_idx += 1
@@ -289,24 +634,22 @@ class InteractiveMenu:
                     selected_idx = max(0, selected_idx - visible_height)
             elif key == curses.KEY_NPAGE:  # Page Down  
                 if history:
-                    selected_idx = min(len(history) - 1, selected_idx + visible_height)
+                    selected_idx = min(n - 1, selected_idx + visible_height)
             elif key == curses.KEY_LEFT:  # Left arrow only
                 break
     
     def draw_menu_with_fixed_bottom(self, stdscr, title: str, data_items: List, fixed_items: List, selected_idx: int, multi_line: bool = False, scroll_offset: int = 0, show_projects_dir: bool = False):
         """Draw menu with scrollable data and fixed bottom options"""
-        stdscr.clear()
+        stdscr.erase()
         h, w = stdscr.getmaxyx()
         
         # Draw config file path
-        config_path_text = f"📁 Config: {self.config_manager.config_path}"
-        stdscr.addstr(0, 0, config_path_text[:w-1], curses.A_DIM)
+        stdscr.addstr(0, 0, self._config_path_text[:w-1], curses.A_DIM)
         
         # Draw projects directory path if requested
         header_offset = 1
         if show_projects_dir:
-            projects_dir_text = f"📂 Projects: {os.path.expanduser('~/.claude/projects')}"
-            stdscr.addstr(1, 0, projects_dir_text[:w-1], curses.A_DIM)
+            stdscr.addstr(1, 0, self._projects_dir_text[:w-1], curses.A_DIM)
             header_offset = 2
         
         # Draw title (without position indicator)
@@ -319,14 +662,6 @@ class InteractiveMenu:
         fixed_items_height = len(fixed_items) + 2  # +2 for separator and spacing
         scrollable_height = h - header_height - fixed_items_height
         
-        # Combine all items for selection
-        all_items = data_items + fixed_items
-        
-        # Draw scrollable data items
-        if data_items:
-            scroll_offset = self._draw_scrollable_items(stdscr, data_items, selected_idx, scroll_offset, 
-                                       header_height, scrollable_height, w, multi_line)
-        
         # Draw separator before fixed items
         separator_y = h - fixed_items_height
         try:
@@ -369,25 +704,102 @@ class InteractiveMenu:
             except curses.error:
                 pass
         
-        stdscr.refresh()
+        # Draw scrollable data items last, since they are shown from an off-screen pad
+        if data_items:
+            scroll_offset = self._draw_scrollable_items(stdscr, data_items, selected_idx, scroll_offset, 
+                                       header_height, scrollable_height, w, multi_line)
+        else:
+            stdscr.noutrefresh()
+        
+        curses.doupdate()
         return scroll_offset
     
+    def _format_multiline_items(self, items: List[Dict], w: int) -> List[List[str]]:
+        """Format dict items as one '  key: value' line per entry"""
+        # Lines are cut to the screen width (and never past 250 chars), ending in "..."
+        cap = min(250, w - 2)
+        item_lines = []
+        for item in items:
+            lines = []
+            for key, value in item.items():
+                display_text = f"  {key}: {value}"
+                if len(display_text) > cap:
+                    display_text = display_text[:cap-3] + "..."
+                lines.append(display_text)
+            item_lines.append(lines)
+        return item_lines
+    
+    def _format_singleline_items(self, items: List) -> List[List[str]]:
+        """Format items as a single line each"""
+        return [[str(item)] for item in items]
+    
+    def _build_items_pad(self, items, w, multi_line):
+        """Lay out items and render them, unhighlighted, into an off-screen pad"""
+        self._pad_items = items
+        self._pad_width = w
+        self._pad_selected = None
+        self._pad_multi_line = multi_line
+        
+        # Choose the layout once per list instead of checking every item each frame
+        if multi_line:
+            self._pad_item_lines = self._format_multiline_items(items, w)
+            separator_lines = 1
+        else:
+            self._pad_item_lines = self._format_singleline_items(items)
+            separator_lines = 0
+        
+        # First line of each item (prefix sums of item heights), plus the total
+        self._pad_line_offsets = [0]
+        for lines in self._pad_item_lines:
+            self._pad_line_offsets.append(self._pad_line_offsets[-1] + len(lines) + separator_lines)
+        
+        try:
+            self._items_pad = curses.newpad(max(1, self._pad_line_offsets[-1]), w)
+        except curses.error:
+            # Too many lines for a curses pad; items are drawn directly instead
+            self._items_pad = None
+            return
+        
+        for idx in range(len(items)):
+            self._paint_pad_item(idx, curses.A_NORMAL)
+        
+        # Separators between multi-line items
+        if multi_line:
+            separator = "  " + "─" * min(w-4, 40)
+            for idx in range(len(items) - 1):
+                try:
+                    self._items_pad.addstr(self._pad_line_offsets[idx + 1] - 1, 0, separator, curses.A_DIM)
+                except curses.error:
+                    pass
+    
+    def _paint_pad_item(self, idx, attr):
+        """Redraw one item's lines in the items pad with the given attribute"""
+        if idx is None or idx >= len(self._pad_item_lines):
+            return
+        
+        top = self._pad_line_offsets[idx]
+        for offset, text in enumerate(self._pad_item_lines[idx]):
+            try:
+                self._items_pad.addnstr(top + offset, 0, text, self._pad_width - 2, attr)
+            except curses.error:
+                pass
+    
     def _draw_scrollable_items(self, stdscr, items, selected_idx, scroll_offset, start_y, max_height, w, multi_line):
-        """Helper to draw scrollable items"""
-        h, _ = stdscr.getmaxyx()
+        """Helper to draw scrollable items
         
-        # Calculate item heights
-        item_heights = []
-        for item in items:
-            if multi_line and isinstance(item, dict):
-                item_heights.append(len(item) + 1)  # +1 for separator
-            else:
-                item_heights.append(1)
+        Items are rendered once into an off-screen pad (rebuilt when the item
+        list or terminal width changes). Each frame then only moves the
+        highlight and copies the visible slice of the pad to the screen.
+        Ends with stdscr.noutrefresh(); the caller calls curses.doupdate().
+        """
+        if self._pad_items is not items or self._pad_width != w:
+            self._build_items_pad(items, w, multi_line)
+        line_offsets = self._pad_line_offsets
         
         # Adjust scroll to keep selected item visible
         if selected_idx < len(items):
-            selected_top = sum(item_heights[:selected_idx])
-            selected_bottom = selected_top + item_heights[selected_idx]
+            selected_top = line_offsets[selected_idx]
+            selected_bottom = line_offsets[selected_idx + 1]
             
             # Only scroll if selected item is outside visible area
             if selected_bottom > scroll_offset + max_height:
@@ -397,70 +809,11 @@ class InteractiveMenu:
                 # Item is above visible area, scroll up
                 scroll_offset = selected_top
         
-        # Draw items
-        current_y = start_y
-        current_line = 0
+        if self._items_pad is None:
+            self._draw_visible_items(stdscr, selected_idx, scroll_offset, start_y, max_height, w)
         
-        for idx, item in enumerate(items):
-            if current_y >= start_y + max_height:
-                break
-            
-            item_height = item_heights[idx]
-            
-            # Skip items above scroll
-            if current_line + item_height <= scroll_offset:
-                current_line += item_height
-                continue
-            
-            is_selected = idx == selected_idx
-            
-            if multi_line and isinstance(item, dict):
-                if is_selected:
-                    stdscr.attron(curses.A_REVERSE)
-                
-                for key, value in item.items():
-                    if current_line >= scroll_offset and current_y < start_y + max_height:
-                        display_text = f"  {key}: {value}"
-                        if len(display_text) > 250:
-                            display_text = display_text[:247] + "..."
-                        display_text = display_text[:w-2]
-                        try:
-                            stdscr.addstr(current_y, 0, display_text)
-                        except curses.error:
-                            pass
-                        current_y += 1
-                    current_line += 1
-                
-                if is_selected:
-                    stdscr.attroff(curses.A_REVERSE)
-                
-                # Separator
-                if idx < len(items) - 1 and current_line >= scroll_offset and current_y < start_y + max_height:
-                    try:
-                        stdscr.addstr(current_y, 0, "  " + "─" * min(w-4, 40), curses.A_DIM)
-                    except curses.error:
-                        pass
-                    current_y += 1
-                current_line += 1
-            else:
-                if current_line >= scroll_offset:
-                    if is_selected:
-                        stdscr.attron(curses.A_REVERSE)
-                    
-                    display_text = str(item)[:w-2]
-                    try:
-                        stdscr.addstr(current_y, 0, display_text)
-                    except curses.error:
-                        pass
-                    
-                    if is_selected:
-                        stdscr.attroff(curses.A_REVERSE)
-                    
-                    current_y += 1
-                current_line += 1
-        
-        # Scroll indicators
-        total_lines = sum(item_heights)
+        # Scroll indicators, on the separator lines just outside the list
+        total_lines = line_offsets[-1]
         if scroll_offset > 0:
             try:
                 stdscr.addstr(start_y - 1, w - 10, "▲ MORE", curses.A_DIM)
@@ -468,26 +821,77 @@ class InteractiveMenu:
                 pass
         if scroll_offset + max_height < total_lines:
             try:
-                stdscr.addstr(start_y + max_height - 1, w - 10, "▼ MORE", curses.A_DIM)
+                stdscr.addstr(start_y + max_height, w - 10, "▼ MORE", curses.A_DIM)
             except curses.error:
                 pass
         
+        stdscr.noutrefresh()
+        
+        if self._items_pad is not None:
+            # Move the highlight by repainting only the two items involved
+            if selected_idx != self._pad_selected:
+                self._paint_pad_item(self._pad_selected, curses.A_NORMAL)
+                self._paint_pad_item(selected_idx, curses.A_REVERSE)
+                self._pad_selected = selected_idx
+            
+            if max_height > 0:
+                try:
+                    self._items_pad.noutrefresh(scroll_offset, 0, start_y, 0, start_y + max_height - 1, w - 1)
+                except curses.error:
+                    pass
+        
         return scroll_offset
     
+    def _draw_visible_items(self, stdscr, selected_idx, scroll_offset, start_y, max_height, w):
+        """Draw the visible laid-out items straight onto the screen (used when no pad is available)"""
+        line_offsets = self._pad_line_offsets
+        last_idx = len(self._pad_item_lines) - 1
+        separator = "  " + "─" * min(w-4, 40)
+        
+        # First pass: collect visible lines as (y, text, attr) without touching curses,
+        # starting from the item that contains the first visible line
+        draw_ops = []
+        first_idx = max(0, bisect.bisect_right(line_offsets, scroll_offset) - 1)
+        for idx in range(first_idx, last_idx + 1):
+            top = line_offsets[idx] - scroll_offset
+            if top >= max_height:
+                break
+            
+            item_attr = curses.A_REVERSE if idx == selected_idx else curses.A_NORMAL
+            for offset, text in enumerate(self._pad_item_lines[idx]):
+                if 0 <= top + offset < max_height:
+                    draw_ops.append((start_y + top + offset, text, item_attr))
+            
+            # Separator
+            if self._pad_multi_line and idx < last_idx:
+                separator_row = line_offsets[idx + 1] - 1 - scroll_offset
+                if 0 <= separator_row < max_height:
+                    draw_ops.append((start_y + separator_row, separator, curses.A_DIM))
+        
+        # Second pass: switch attributes only when they change between lines
+        current_attr = None
+        for y, text, attr in draw_ops:
+            if attr != current_attr:
+                stdscr.attrset(attr)
+                current_attr = attr
+            try:
+                stdscr.addnstr(y, 0, text, w - 2)
+            except curses.error:
+                pass
+        stdscr.attrset(curses.A_NORMAL)
+    
     def draw_menu(self, stdscr, title: str, items: List, selected_idx: int, multi_line: bool = False, scroll_offset: int = 0, show_projects_dir: bool = False):
         """Draw menu with title and items with scrolling support"""
-        stdscr.clear()
+        stdscr.erase()
         h, w = stdscr.getmaxyx()
         
         # Draw config file path
-        config_path_text = f"📁 Config: {self.config_manager.config_path}"
-        stdscr.addstr(0, 0, config_path_text[:w-1], curses.A_DIM)
+        stdscr.addstr(0, 0, self._config_path_text[:w-1], curses.A_DIM)
         
         # Draw projects directory path if requested
         header_offset = 1
         if show_projects_dir:
-            projects_dir_text = f"📂 Projects: {os.path.expanduser('~/.claude/projects')}"
-            stdscr.addstr(1, 0, projects_dir_text[:w-1], curses.A_DIM)
+            stdscr.addstr(1, 0, self._projects_dir_text[:w-1], curses.A_DIM)
             header_offset = 2
         
         # Draw title with position indicator for regular menu
@@ -511,18 +915,24 @@ class InteractiveMenu:
         footer_height = 2
         visible_height = h - header_height - footer_height
         
-        # Calculate lines needed for each item
+        # Calculate lines needed for each item, and the first line of each (prefix sums)
         item_heights = []
+        line_offsets = [0]
         for item in items:
             if multi_line and isinstance(item, dict):
                 # Each dict item takes len(dict) + 1 (separator) lines
                 item_heights.append(len(item) + 1)
             else:
                 item_heights.append(1)
+            line_offsets.append(line_offsets[-1] + item_heights[-1])
         
         # Calculate scroll position to keep selected item visible
-        selected_item_top = sum(item_heights[:selected_idx])
-        selected_item_bottom = selected_item_top + (item_heights[selected_idx] if selected_idx < len(item_heights) else 1)
+        if selected_idx < len(items):
+            selected_item_top = line_offsets[selected_idx]
+            selected_item_bottom = line_offsets[selected_idx + 1]
+        else:
+            selected_item_top = line_offsets[-1]
+            selected_item_bottom = selected_item_top + 1
         
         # Adjust scroll offset to keep selected item in view
         if selected_item_bottom - scroll_offset > visible_height:
@@ -530,9 +940,12 @@ class InteractiveMenu:
         elif selected_item_top < scroll_offset:
             scroll_offset = selected_item_top
         
-        # Draw items with scrolling
+        # Draw items with scrolling (hot loop: bind the bottom edge and addstr once)
         current_y = header_height
         current_line = 0
+        bottom_y = h - footer_height
+        addstr = stdscr.addstr
+        cap = min(250, w - 2)
         
         for idx, item in enumerate(items):
             item_height = item_heights[idx] if idx < len(item_heights) else 1
@@ -543,7 +956,7 @@ class InteractiveMenu:
                 continue
             
             # Stop if we've filled the visible area
-            if current_y >= h - footer_height:
+            if current_y >= bottom_y:
                 break
             
             is_selected = idx == selected_idx
@@ -555,16 +968,13 @@ class InteractiveMenu:
                 
                 # Draw each line of the item
                 for key, value in item.items():
-                    if current_line >= scroll_offset and current_y < h - footer_height:
-                        # Don't truncate at screen width for long values
+                    if current_line >= scroll_offset and current_y < bottom_y:
+                        # Cut to screen width (at most 250 chars) in a single slice
                         display_text = f"  {key}: {value}"
-                        # Only truncate if extremely long (> 250 chars total)
-                        if len(display_text) > 250:
-                            display_text = display_text[:247] + "..."
-                        # Now truncate for screen width
-                        display_text = display_text[:w-2]
+                        if len(display_text) > cap:
+                            display_text = display_text[:cap-3] + "..."
                         try:
-                            stdscr.addstr(current_y, 0, display_text)
+                            addstr(current_y, 0, display_text)
                         except curses.error:
                             pass
                         current_y += 1
@@ -575,9 +985,9 @@ class InteractiveMenu:
                 
                 # Add separator between items
                 if idx < len(items) - 1:
-                    if current_line >= scroll_offset and current_y < h - footer_height:
+                    if current_line >= scroll_offset and current_y < bottom_y:
                         try:
-                            stdscr.addstr(current_y, 0, "  " + "─" * min(w-4, 40), curses.A_DIM)
+                            addstr(current_y, 0, "  " + "─" * min(w-4, 40), curses.A_DIM)
                         except curses.error:
                             pass
                         current_y += 1
@@ -590,7 +1000,7 @@ class InteractiveMenu:
                     
                     display_text = str(item)[:w-2]
                     try:
-                        stdscr.addstr(current_y, 0, display_text)
+                        addstr(current_y, 0, display_text)
                     except curses.error:
                         pass
                         
@@ -601,7 +1011,7 @@ class InteractiveMenu:
                 current_line += 1
         
         # Show scroll indicators if needed
-        total_lines = sum(item_heights)
+        total_lines = line_offsets[-1]
         if scroll_offset > 0:
             stdscr.addstr(header_height - 1, w - 10, "▲ MORE", curses.A_DIM)
         if scroll_offset + visible_height < total_lines:
@@ -610,93 +1020,103 @@ class InteractiveMenu:
         stdscr.refresh()
         return scroll_offset
     
-    def mcp_server_menu(self, stdscr):
-        """MCP Server management menu"""
-        servers = self.config_manager.get_mcp_servers()
+    def _build_server_items(self, servers: Dict) -> List[Dict]:
+        """Format MCP servers as multi-line menu items"""
+        server_items = []
+        row_cache = self._server_row_cache
+        for name, server in servers.items():
+            cached = row_cache.get(name)
+            if cached is not None and cached[0] == server:
+                server_items.append(cached[1])
+                continue
+            
+            # Format server info as multi-line dict
+            server_type = server.get('type', 'stdio')
+            command = server.get('command', 'N/A')
+            args = server.get('args', [])
+            args_str = ' '.join(args) if args else 'No args'
+            
+            # Truncate long args (show up to 200 chars)
+            if len(args_str) > 200:
+                args_str = args_str[:100] + "..." + args_str[-97:]
+            
+            # Truncate long command paths (show up to 200 chars)
+            display_command = command
+            if len(command) > 200:
+                display_command = command[:100] + "..." + command[-97:]
+            
+            item = {
+                "🔧 Server": name,
+                "📋 Type": server_type,
+                "⚙️  Cmd": display_command,
+                "📝 Args": args_str
+            }
+            row_cache[name] = (server, item)
+            server_items.append(item)
+        return server_items
+    
+    def _run_list_menu(self, stdscr, load_items, make_title, on_open, on_delete, on_delete_all,
+                       delete_all_label: str, empty_label: str, item_height: int, show_projects_dir: bool = False):
+        """Run a list of multi-line entries with DELETE ALL / Back options below it
+        
+        load_items() returns (keys, items): the entry keys in display order and their
+        formatted rows. on_open(key) shows an entry, on_delete(key) deletes one, and
+        on_delete_all() asks for confirmation and returns True if everything was deleted.
+        """
         selected_idx = 0
         scroll_offset = 0
+        # Entries are (re)loaded only on entry and after deletions
+        keys, data_items = load_items()
+        # Set when the last key changed what's on screen
+        redraw = True
         
         while True:
             h, w = stdscr.getmaxyx()
             
-            # Prepare server items (data only)
-            server_items = []
-            server_names = list(servers.keys())
-            
-            for name in server_names:
-                server = servers[name]
-                # Format server info as multi-line dict
-                server_type = server.get('type', 'stdio')
-                command = server.get('command', 'N/A')
-                args = server.get('args', [])
-                args_str = ' '.join(args) if args else 'No args'
-                
-                # Truncate long args (show up to 200 chars)
-                if len(args_str) > 200:
-                    args_str = args_str[:100] + "..." + args_str[-97:]
-                
-                # Truncate long command paths (show up to 200 chars)
-                display_command = command
-                if len(command) > 200:
-                    display_command = command[:100] + "..." + command[-97:]
-                
-                item = {
-                    "🔧 Server": name,
-                    "📋 Type": server_type,
-                    "⚙️  Cmd": display_command,
-                    "📝 Args": args_str
-                }
-                server_items.append(item)
-            
             # Fixed menu options (always at bottom)
             fixed_options = []
-            if server_names:  # Check server_names instead of server_items
-                fixed_options.append("🗑️  [ DELETE ALL SERVERS ]")
+            if keys:  # Check keys instead of data_items
+                fixed_options.append(delete_all_label)
+                list_items = data_items
             else:
-                server_items.append("⚠️  [ No servers configured ]")
+                list_items = [empty_label]
             fixed_options.append("◀️  [ Back to Main Menu ]")
             
             # Combine for selection logic
-            all_items = server_items + fixed_options
-            items = all_items  # For compatibility with existing code
-            
-            # Draw menu with fixed bottom
-            if server_names:
-                title = f"🖥️  MCP Servers Management ({len(server_names)} servers)"
-                scroll_offset = self.draw_menu_with_fixed_bottom(
-                    stdscr, title, 
-                    server_items, fixed_options, selected_idx, 
-                    multi_line=True, scroll_offset=scroll_offset
-                )
-            else:
-                # No servers, use regular menu
-                title = "🖥️  MCP Servers Management (0 servers)"
-                scroll_offset = self.draw_menu(
-                    stdscr, title, 
-                    items, selected_idx, multi_line=True, scroll_offset=scroll_offset
-                )
+            items = list_items + fixed_options
+            
+            if redraw and not self._input_pending(stdscr):
+                title = make_title(len(keys))
+                if keys:
+                    # Draw menu with fixed bottom
+                    scroll_offset = self.draw_menu_with_fixed_bottom(
+                        stdscr, title, 
+                        list_items, fixed_options, selected_idx, 
+                        multi_line=True, scroll_offset=scroll_offset, show_projects_dir=show_projects_dir
+                    )
+                else:
+                    # Nothing configured, use regular menu
+                    scroll_offset = self.draw_menu(
+                        stdscr, title, 
+                        items, selected_idx, multi_line=True, scroll_offset=scroll_offset, show_projects_dir=show_projects_dir
+                    )
+                redraw = False
             
-            # Calculate items per page for navigation
-            items_per_page = 5
-            if server_items:
-                # For multi-line server items (4 lines each + separator)
-                items_per_page = max(1, (h - 10) // 5)
+            # Calculate items per page for navigation (each entry plus its separator)
+            items_per_page = max(1, (h - 10) // item_height)
             
             # Handle input
             key = stdscr.getch()
             
             if key == curses.KEY_UP:
-                if selected_idx == 0:
-                    selected_idx = len(items) - 1  # Wrap to last
-                else:
-                    selected_idx = selected_idx - 1
+                redraw = True
+                selected_idx = (selected_idx - 1) % len(items)  # Wraps to last
             elif key == curses.KEY_DOWN:
-                if selected_idx == len(items) - 1:
-                    selected_idx = 0  # Wrap to first
-                else:
-                    selected_idx = selected_idx + 1
+                redraw = True
+                selected_idx = (selected_idx + 1) % len(items)  # Wraps to first
             elif key == curses.KEY_PPAGE:  # Page Up
-                if selected_idx < len(server_items):
+                redraw = True
+                if selected_idx < len(list_items):
                     current_page = selected_idx // items_per_page
                     if current_page > 0:
                         selected_idx = (current_page - 1) * items_per_page
@@ -705,341 +1125,329 @@ class InteractiveMenu:
                         selected_idx = 0
                 else:
                     # Jump to last data page from fixed menu
-                    if server_items:
-                        last_page = (len(server_items) - 1) // items_per_page
-                        selected_idx = last_page * items_per_page
+                    last_page = (len(list_items) - 1) // items_per_page
+                    selected_idx = last_page * items_per_page
             elif key == curses.KEY_NPAGE:  # Page Down
-                if selected_idx < len(server_items):
+                redraw = True
+                if selected_idx < len(list_items):
                     current_page = selected_idx // items_per_page
                     next_page = current_page + 1
-                    if next_page * items_per_page < len(server_items):
+                    if next_page * items_per_page < len(list_items):
                         selected_idx = next_page * items_per_page
                     else:
                         # Go to fixed menu
-                        selected_idx = len(server_items)
+                        selected_idx = len(list_items)
                 else:
                     # Stay in fixed menu
                     pass
+            elif key == curses.KEY_RESIZE:
+                redraw = True
             elif key == curses.KEY_LEFT:  # Left arrow only
                 break
             elif key == ord('d') or key == ord('D') or key == 12615:  # Delete key (d, D, or Korean ㅇ)
-                if selected_idx < len(server_names):  # Only delete individual servers with 'd' key
-                    # Delete individual server immediately
-                    server_to_delete = server_names[selected_idx]
-                    self.config_manager.delete_mcp_server(server_to_delete)
-                    servers = self.config_manager.get_mcp_servers()
+                if selected_idx < len(keys):  # Only delete individual entries with 'd' key
+                    # Delete individual entry immediately
+                    on_delete(keys[selected_idx])
+                    keys, data_items = load_items()
                     # Adjust selected index after deletion
-                    if selected_idx >= len(servers):
-                        selected_idx = max(0, len(servers) - 1 if servers else 0)
+                    if selected_idx >= len(keys):
+                        selected_idx = max(0, len(keys) - 1)
                     # Continue to refresh the screen
+                    redraw = True
                     continue
                 # Don't delete "DELETE ALL" or "Back to Main" with 'd' key
             elif key == ord('\n') or key == curses.KEY_RIGHT:  # Enter or Right arrow
+                # Sub-screens and dialogs draw over the menu
+                redraw = True
                 if selected_idx == len(items) - 1:  # Back to main
                     break
-                elif selected_idx < len(server_names):  # Check against actual server count
-                    # Show installation command for the selected server
-                    self.show_mcp_install_command(stdscr, server_names[selected_idx], servers[server_names[selected_idx]])
-                elif server_names and selected_idx == len(server_items):  # DELETE ALL option
-                    # Delete all servers with Enter key - show confirmation
-                    if self.show_confirmation(stdscr, "⚠️  Delete ALL MCP Servers?", 
-                                            f"This will delete all {len(server_names)} configured servers.",
-                                            "This action cannot be undone!"):
-                        self.config_manager.delete_all_mcp_servers()
-                        servers = self.config_manager.get_mcp_servers()
+                elif selected_idx < len(keys):  # Check against actual entry count
+                    on_open(keys[selected_idx])
+                elif keys and selected_idx == len(list_items):  # DELETE ALL option
+                    # Delete all entries with Enter key - on_delete_all shows the confirmation
+                    if on_delete_all():
+                        keys, data_items = load_items()
                         selected_idx = 0
                     continue
+        
+        # Write all deletions made in this menu at once
+        self.config_manager.flush()
+    
+    def mcp_server_menu(self, stdscr):
+        """MCP Server management menu"""
+        servers = {}
+        
+        def load_servers():
+            nonlocal servers
+            servers = self.config_manager.get_mcp_servers()
+            return list(servers.keys()), self._build_server_items(servers)
+        
+        def open_server(name):
+            # Show installation command for the selected server
+            self.show_mcp_install_command(stdscr, name, servers[name])
+        
+        def delete_server(name):
+            if self.config_manager.delete_mcp_server(name):
+                self._server_row_cache.pop(name, None)
+        
+        def delete_all_servers():
+            if not self.show_confirmation(stdscr, "⚠️  Delete ALL MCP Servers?", 
+                                          f"This will delete all {len(servers)} configured servers.",
+                                          "This action cannot be undone!"):
+                return False
+            if not self.config_manager.delete_all_mcp_servers():
+                return False
+            self._server_row_cache.clear()
+            return True
+        
+        self._run_list_menu(
+            stdscr, load_servers,
+            lambda count: f"🖥️  MCP Servers Management ({count} servers)",
+            open_server, delete_server, delete_all_servers,
+            "🗑️  [ DELETE ALL SERVERS ]", "⚠️  [ No servers configured ]",
+            item_height=5  # 4 lines + separator
+        )
     
     def show_mcp_install_command(self, stdscr, server_name: str, server_data: Dict):
         """Show MCP installation command for a server"""
+        # Build the claude mcp add command
+        cmd_parts = ["claude", "mcp", "add"]
+        
+        # Get server type (stdio, sse, http)
+        transport = server_data.get('type', 'stdio')
+        
+        # Add transport flag if not stdio
+        if transport in ['sse', 'http']:
+            cmd_parts.extend(['--transport', transport])
+        
+        # Add server name
+        cmd_parts.append(server_name)
+        
+        # Add environment variables if present
+        env = server_data.get('env', {})
+        for key, value in env.items():
+            cmd_parts.extend(['--env', f'{key}={value}'])
+        
+        # For stdio: add "--" separator before command and args
+        # For sse/http: add URL directly
+        if transport == 'stdio':
+            # Add -- separator for stdio servers
+            cmd_parts.append('--')
+            
+            # Add command
+            command = server_data.get('command', '')
+            if command:
+                cmd_parts.append(command)
+            
+            # Add args
+            args = server_data.get('args', [])
+            cmd_parts.extend(args)
+        else:
+            # For SSE/HTTP servers, add URL (if available)
+            url = server_data.get('url', '')
+            if url:
+                cmd_parts.append(url)
+            elif command := server_data.get('command', ''):
+                # Fallback to command if URL not present
+                cmd_parts.append(command)
+        
+        # Build full command
+        full_command = ' '.join(cmd_parts)
+        
+        # Server info lines as (text, clip to screen width), formatted once
+        info_lines = [(f"Type: {transport}", False)]
+        if transport == 'stdio':
+            info_lines.append((f"Command: {command}", False))
+            if args:
+                info_lines.append((f"Args: {' '.join(args)}", True))
+        else:
+            # For SSE/HTTP servers
+            if url:
+                info_lines.append((f"URL: {url}", True))
+            elif command:
+                info_lines.append((f"Command: {command}", True))
+        if env:
+            info_lines.append((f"Env: {str(env)}", True))
+        
+        # Terminal width the command was last wrapped for
+        wrapped_width = None
+        # Terminal size the screen was last drawn for
+        drawn_size = None
+        
         while True:
-            stdscr.clear()
             h, w = stdscr.getmaxyx()
             
-            # Draw header
-            stdscr.addstr(0, 0, f"🔧 MCP Server: {server_name}", curses.A_BOLD)
-            stdscr.addstr(1, 0, "═" * min(w-1, 60))
-            stdscr.addstr(2, 0, "💡 Press ← to go back")
-            stdscr.addstr(3, 0, "═" * min(w-1, 60))
-            
-            # Build the claude mcp add command
-            cmd_parts = ["claude", "mcp", "add"]
-            
-            # Get server type (stdio, sse, http)
-            transport = server_data.get('type', 'stdio')
-            
-            # Add transport flag if not stdio
-            if transport in ['sse', 'http']:
-                cmd_parts.extend(['--transport', transport])
-            
-            # Add server name
-            cmd_parts.append(server_name)
-            
-            # Add environment variables if present
-            env = server_data.get('env', {})
-            for key, value in env.items():
-                cmd_parts.extend(['--env', f'{key}={value}'])
-            
-            # For stdio: add "--" separator before command and args
-            # For sse/http: add URL directly
-            if transport == 'stdio':
-                # Add -- separator for stdio servers
-                cmd_parts.append('--')
+            # Nothing on this screen changes with input, so draw only for a new size
+            if (h, w) != drawn_size:
+                stdscr.erase()
                 
-                # Add command
-                command = server_data.get('command', '')
-                if command:
-                    cmd_parts.append(command)
+                # Draw header
+                stdscr.addstr(0, 0, f"🔧 MCP Server: {server_name}", curses.A_BOLD)
+                stdscr.addstr(1, 0, "═" * min(w-1, 60))
+                stdscr.addstr(2, 0, "💡 Press ← to go back")
+                stdscr.addstr(3, 0, "═" * min(w-1, 60))
                 
-                # Add args
-                args = server_data.get('args', [])
-                cmd_parts.extend(args)
-            else:
-                # For SSE/HTTP servers, add URL (if available)
-                url = server_data.get('url', '')
-                if url:
-                    cmd_parts.append(url)
-                elif command := server_data.get('command', ''):
-                    # Fallback to command if URL not present
-                    cmd_parts.append(command)
-            
-            # Build full command
-            full_command = ' '.join(cmd_parts)
-            
-            # Display server info
-            y = 5
-            stdscr.addstr(y, 0, "Server Configuration:", curses.A_BOLD)
-            y += 1
-            stdscr.addstr(y, 2, f"Type: {transport}")
-            y += 1
-            
-            if transport == 'stdio':
-                command = server_data.get('command', '')
-                args = server_data.get('args', [])
-                stdscr.addstr(y, 2, f"Command: {command}")
+                # Display server info
+                y = 5
+                stdscr.addstr(y, 0, "Server Configuration:", curses.A_BOLD)
                 y += 1
-                if args:
-                    stdscr.addstr(y, 2, f"Args: {' '.join(args)}"[:w-4])
+                for text, clip in info_lines:
+                    stdscr.addstr(y, 2, text[:w-4] if clip else text)
                     y += 1
-            else:
-                # For SSE/HTTP servers
-                url = server_data.get('url', '')
-                if url:
-                    stdscr.addstr(y, 2, f"URL: {url}"[:w-4])
-                    y += 1
-                elif command := server_data.get('command', ''):
-                    stdscr.addstr(y, 2, f"Command: {command}"[:w-4])
-                    y += 1
-            
-            if env:
-                stdscr.addstr(y, 2, f"Env: {str(env)}"[:w-4])
+                
+                # Display installation command
+                y += 2
+                stdscr.addstr(y, 0, "Installation Command:", curses.A_BOLD)
                 y += 1
-            
-            # Display installation command
-            y += 2
-            stdscr.addstr(y, 0, "Installation Command:", curses.A_BOLD)
-            y += 1
-            
-            # Wrap long command if needed
-            if len(full_command) > w - 4:
-                # Split command into multiple lines
-                lines = []
-                current_line = ""
-                for part in cmd_parts:
-                    if len(current_line) + len(part) + 1 > w - 6:
-                        lines.append(current_line)
-                        current_line = "  " + part  # Indent continuation
-                    else:
-                        current_line += (" " if current_line else "") + part
-                if current_line:
-                    lines.append(current_line)
                 
-                for line in lines:
-                    if y < h - 2:
-                        try:
-                            stdscr.addstr(y, 2, line)
-                        except curses.error:
-                            pass
-                        y += 1
-            else:
-                try:
-                    stdscr.addstr(y, 2, full_command)
-                except curses.error:
-                    pass
-            
-            # Add note about scope
-            y += 2
-            if y < h - 2:
-                stdscr.addstr(y, 0, "Note: Add -s user for user scope or -s project for project scope", curses.A_DIM)
-            
-            stdscr.refresh()
+                # Wrap long command if needed
+                if len(full_command) > w - 4:
+                    # Split command into multiple lines, again only if the width changed
+                    if w != wrapped_width:
+                        # Indent continuation lines; never split a path or flag in two
+                        lines = textwrap.wrap(full_command, width=max(1, w - 6), subsequent_indent="  ",
+                                              break_long_words=False, break_on_hyphens=False)
+                        wrapped_width = w
+                    
+                    for line in lines:
+                        if y < h - 2:
+                            # Words textwrap can't split may be wider than the screen; clip them
+                            stdscr.addnstr(y, 2, line, w - 3)
+                            y += 1
+                else:
+                    # Fits the width (checked above), so only the row needs bounds checking
+                    if y < h:
+                        stdscr.addstr(y, 2, full_command)
+                
+                # Add note about scope
+                y += 2
+                if y < h - 2:
+                    stdscr.addstr(y, 0, "Note: Add -s user for user scope or -s project for project scope", curses.A_DIM)
+                
+                stdscr.refresh()
+                drawn_size = (h, w)
             
             # Wait for left arrow to go back
             key = stdscr.getch()
             if key == curses.KEY_LEFT:
                 break
+            elif key == curses.KEY_RESIZE:
+                drawn_size = None
+    
+    def _project_row(self, path: str, project: Dict) -> Dict:
+        """Format one project as a multi-line menu item, reusing the cached row if still current"""
+        # Get history count
+        history_count = project.get('history_len', len(project.get('history', [])))
+        # Get generated time
+        generated_at = project.get('exampleFilesGeneratedAt', 0)
+        
+        # Reuse the formatted row unless the displayed values changed
+        stamp = (generated_at, history_count)
+        cached = self._project_row_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        time_str = self.format_timestamp(generated_at) if generated_at else "N/A"
+        
+        # Format project name (last part of path)
+        project_name = os.path.basename(path) or path
+        
+        # Truncate long paths (show up to 200 chars)
+        display_path = path
+        if len(path) > 200:
+            display_path = path[:100] + "..." + path[-97:]
+        
+        item = {
+            "📂 Project": project_name,
+            "💬 History": f"{history_count} messages",
+            "🕐 Generated": time_str,
+            "📍 Path": display_path
+        }
+        self._project_row_cache[path] = (stamp, item)
+        return item
+    
+    def _build_project_items(self, projects: Dict, project_paths: List[str]) -> List[Dict]:
+        """Format projects as multi-line menu items, in project_paths order"""
+        project_row = self._project_row
+        return [project_row(path, projects[path]) for path in project_paths]
+    
+    def _count_project_dirs(self) -> int:
+        """Count directories in .claude/projects, rescanning only when it changes"""
+        claude_projects_dir = self.config_manager.projects_dir
+        try:
+            mtime = os.stat(claude_projects_dir).st_mtime_ns
+        except OSError:
+            return 0
+        # Adding or removing entries updates the directory's mtime
+        if mtime != self._claude_dir_mtime:
+            try:
+                with os.scandir(claude_projects_dir) as entries:
+                    self._claude_dir_count = sum(1 for entry in entries if entry.is_dir())
+            except OSError:
+                self._claude_dir_count = 0
+            self._claude_dir_mtime = mtime
+        return self._claude_dir_count
     
     def projects_menu(self, stdscr):
         """Projects management menu"""
-        projects = self.config_manager.get_projects()
-        selected_idx = 0
-        scroll_offset = 0
+        projects = {}
+        self._sorted_project_paths = None
         
-        while True:
-            h, w = stdscr.getmaxyx()
-            
-            # Count directories in .claude/projects
-            claude_projects_dir = os.path.expanduser("~/.claude/projects")
-            claude_dir_count = 0
-            if os.path.exists(claude_projects_dir):
-                try:
-                    claude_dir_count = len([d for d in os.listdir(claude_projects_dir) 
-                                           if os.path.isdir(os.path.join(claude_projects_dir, d))])
-                except:
-                    pass
-            
-            # Prepare project items (data only)
-            project_items = []
-            project_paths = list(projects.keys())
-            
-            # Sort projects by exampleFilesGeneratedAt (most recent first)
-            project_paths.sort(key=lambda p: projects[p].get('exampleFilesGeneratedAt', 0), reverse=True)
-            
-            for path in project_paths:
-                project = projects[path]
-                # Get history count
-                history_count = len(project.get('history', []))
-                # Get generated time
-                generated_at = project.get('exampleFilesGeneratedAt', 0)
-                time_str = self.format_timestamp(generated_at) if generated_at else "N/A"
-                
-                # Format project name (last part of path)
-                project_name = os.path.basename(path) or path
-                
-                # Truncate long paths (show up to 200 chars)
-                display_path = path
-                if len(path) > 200:
-                    display_path = path[:100] + "..." + path[-97:]
-                
-                item = {
-                    "📂 Project": project_name,
-                    "💬 History": f"{history_count} messages",
-                    "🕐 Generated": time_str,
-                    "📍 Path": display_path
-                }
-                project_items.append(item)
-            
-            # Fixed menu options (always at bottom)
-            fixed_options = []
-            if project_paths:  # Check project_paths instead of project_items
-                fixed_options.append("🗑️  [ DELETE ALL PROJECTS ]")
-            else:
-                project_items.append("⚠️  [ No projects configured ]")
-            fixed_options.append("◀️  [ Back to Main Menu ]")
-            
-            # Combine for selection logic
-            all_items = project_items + fixed_options
-            items = all_items  # For compatibility with existing code
-            
-            # Draw menu with fixed bottom
-            if project_paths:
-                # Include directory count in title if different from project count
-                if claude_dir_count != len(project_paths):
-                    title = f"📚 Projects Management ({len(project_paths)} projects, {claude_dir_count} dirs)"
-                else:
-                    title = f"📚 Projects Management ({len(project_paths)} projects)"
-                scroll_offset = self.draw_menu_with_fixed_bottom(
-                    stdscr, title, 
-                    project_items, fixed_options, selected_idx, 
-                    multi_line=True, scroll_offset=scroll_offset, show_projects_dir=True
-                )
-            else:
-                # No projects, use regular menu
-                if claude_dir_count > 0:
-                    title = f"📚 Projects Management (0 projects, {claude_dir_count} dirs)"
-                else:
-                    title = "📚 Projects Management (0 projects)"
-                scroll_offset = self.draw_menu(
-                    stdscr, title, 
-                    items, selected_idx, multi_line=True, scroll_offset=scroll_offset, show_projects_dir=True
+        def load_projects():
+            nonlocal projects
+            projects = self.config_manager.get_projects()
+            # Sort projects by exampleFilesGeneratedAt (most recent first) once per config;
+            # deleting a project just drops it from the sorted list. A reloaded config
+            # is a new dict and may have gained or lost projects, so it is sorted afresh.
+            if self._sorted_project_paths is None or self._sorted_projects_source is not projects:
+                self._sorted_project_paths = sorted(
+                    projects, key=lambda p: projects[p].get('exampleFilesGeneratedAt', 0), reverse=True
                 )
-            
-            # Calculate items per page for navigation
-            items_per_page = 5
-            if project_items:
-                # For multi-line project items (5 lines each + separator)
-                items_per_page = max(1, (h - 10) // 6)
-            
-            # Handle input
-            key = stdscr.getch()
-            
-            if key == curses.KEY_UP:
-                if selected_idx == 0:
-                    selected_idx = len(items) - 1  # Wrap to last
-                else:
-                    selected_idx = selected_idx - 1
-            elif key == curses.KEY_DOWN:
-                if selected_idx == len(items) - 1:
-                    selected_idx = 0  # Wrap to first
-                else:
-                    selected_idx = selected_idx + 1
-            elif key == curses.KEY_PPAGE:  # Page Up
-                if selected_idx < len(project_items):
-                    current_page = selected_idx // items_per_page
-                    if current_page > 0:
-                        selected_idx = (current_page - 1) * items_per_page
-                    else:
-                        # Already at first page, stay
-                        selected_idx = 0
-                else:
-                    # Jump to last data page from fixed menu
-                    if project_items:
-                        last_page = (len(project_items) - 1) // items_per_page
-                        selected_idx = last_page * items_per_page
-            elif key == curses.KEY_NPAGE:  # Page Down
-                if selected_idx < len(project_items):
-                    current_page = selected_idx // items_per_page
-                    next_page = current_page + 1
-                    if next_page * items_per_page < len(project_items):
-                        selected_idx = next_page * items_per_page
-                    else:
-                        # Go to fixed menu
-                        selected_idx = len(project_items)
-                else:
-                    # Stay in fixed menu
-                    pass
-            elif key == curses.KEY_LEFT:  # Left arrow only
-                break
-            elif key == ord('d') or key == ord('D') or key == 12615:  # Delete key (d, D, or Korean ㅇ)
-                if selected_idx < len(project_paths):  # Only delete individual projects with 'd' key
-                    # Delete individual project immediately
-                    project_to_delete = project_paths[selected_idx]
-                    self.config_manager.delete_project(project_to_delete)
-                    projects = self.config_manager.get_projects()
-                    # Adjust selected index after deletion
-                    if selected_idx >= len(projects):
-                        selected_idx = max(0, len(projects) - 1 if projects else 0)
-                    # Continue to refresh the screen
-                    continue
-                # Don't delete "DELETE ALL" or "Back to Main" with 'd' key
-            elif key == ord('\n') or key == curses.KEY_RIGHT:  # Enter or Right arrow
-                if selected_idx == len(items) - 1:  # Back to main
-                    break
-                elif selected_idx < len(project_paths):  # Check against actual project count
-                    # Show conversation history for the selected project
-                    self.show_project_history(stdscr, project_paths[selected_idx], projects[project_paths[selected_idx]])
-                elif project_paths and selected_idx == len(project_items):  # DELETE ALL option
-                    # Delete all projects with Enter key - show confirmation
-                    if self.show_confirmation(stdscr, "⚠️  Delete ALL Projects?", 
-                                            f"This will delete all {len(project_paths)} projects and their data.",
-                                            "This will also clear the entire .claude/projects directory!"):
-                        self.config_manager.delete_all_projects()
-                        projects = self.config_manager.get_projects()
-                        selected_idx = 0
-                    continue
+                self._sorted_projects_source = projects
+            project_paths = self._sorted_project_paths
+            return project_paths, self._build_project_items(projects, project_paths)
+        
+        def make_title(count):
+            # Include directory count in title if different from project count
+            claude_dir_count = self._count_project_dirs()
+            if claude_dir_count != count:
+                return f"📚 Projects Management ({count} projects, {claude_dir_count} dirs)"
+            return f"📚 Projects Management ({count} projects)"
+        
+        def open_project(path):
+            # Show conversation history for the selected project
+            self.show_project_history(stdscr, path, projects[path])
+        
+        def delete_project(path):
+            if self.config_manager.delete_project(path):
+                self._project_row_cache.pop(path, None)
+                self._sorted_project_paths.remove(path)
+        
+        def delete_all_projects():
+            if not self.show_confirmation(stdscr, "⚠️  Delete ALL Projects?", 
+                                          f"This will delete all {len(projects)} projects and their data.",
+                                          "This will also clear the entire .claude/projects directory!"):
+                return False
+            if not self.config_manager.delete_all_projects():
+                return False
+            self._project_row_cache.clear()
+            self._sorted_project_paths = None
+            # The directory was recreated; don't trust its mtime to differ
+            self._claude_dir_mtime = None
+            return True
+        
+        self._run_list_menu(
+            stdscr, load_projects, make_title,
+            open_project, delete_project, delete_all_projects,
+            "🗑️  [ DELETE ALL PROJECTS ]", "⚠️  [ No projects configured ]",
+            item_height=6,  # 5 lines + separator
+            show_projects_dir=True
+        )
     
     def main_menu(self, stdscr):
         """Main menu"""
+        # No screen position depends on the cursor, so refresh needn't move it back
+        stdscr.leaveok(True)
         selected_idx = 0
         menu_items = [
             "1. Manage MCP Servers",
@@ -1048,20 +1456,15 @@ class InteractiveMenu:
         ]
         
         while True:
-            self.draw_menu(stdscr, "🤖 Claude Config Manager", menu_items, selected_idx)
+            if not self._input_pending(stdscr):
+                self.draw_menu(stdscr, "🤖 Claude Config Manager", menu_items, selected_idx)
             
             key = stdscr.getch()
             
             if key == curses.KEY_UP:
-                if selected_idx == 0:
-                    selected_idx = len(menu_items) - 1  # Wrap to last
-                else:
-                    selected_idx = selected_idx - 1
+                selected_idx = (selected_idx - 1) % len(menu_items)  # Wraps to last
             elif key == curses.KEY_DOWN:
-                if selected_idx == len(menu_items) - 1:
-                    selected_idx = 0  # Wrap to first
-                else:
-                    selected_idx = selected_idx + 1
+                selected_idx = (selected_idx + 1) % len(menu_items)  # Wraps to first
             elif key == ord('\n') or key == curses.KEY_RIGHT:  # Enter or Right arrow
                 if selected_idx == 0:
                     self.mcp_server_menu(stdscr)
@@ -1083,12 +1486,21 @@ class InteractiveMenu:
             if 'TERM' not in os.environ:
                 os.environ['TERM'] = 'xterm-256color'
             
+            # Closing the terminal (SIGHUP) or a kill (SIGTERM) would skip the
+            # finally below; exit through SystemExit so pending deletions are saved
+            for signame in ('SIGHUP', 'SIGTERM'):
+                if hasattr(signal, signame):
+                    signal.signal(getattr(signal, signame), _exit_on_signal)
+            
             curses.wrapper(self.main_menu)
         except curses.error as e:
             print(f"Terminal does not support interactive mode: {e}")
             print("Please run this script in a proper terminal emulator")
         except KeyboardInterrupt:
             pass
+        finally:
+            # Don't lose deletions if the menu exited abnormally
+            self.config_manager.flush()
 
 
 def main():